@@ -0,0 +1,80 @@
+"""
+Optional numba kernels for hot pixel loops.
+
+numba is not a hard dependency: when it is missing HAVE_NUMBA is False and
+callers fall back to their NumPy implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _int_clims(cache, n_levels, pct_low, pct_high, interpolate):
+        n_channels = cache.shape[0]
+        out = np.zeros((n_channels, 2))
+        for c in prange(n_channels):
+            counts = np.zeros(n_levels, np.int64)
+            plane = cache[c]
+            for y in range(plane.shape[0]):
+                for x in range(plane.shape[1]):
+                    counts[plane[y, x]] += 1
+
+            # Ranks among non-zero pixels (zeros are background)
+            n_pos = plane.size - counts[0]
+            if n_pos == 0:
+                continue
+            pos_lo = pct_low / 100.0 * (n_pos - 1)
+            pos_hi = pct_high / 100.0 * (n_pos - 1)
+            k_lo = int(pos_lo)
+            k_hi = int(pos_hi)
+            ranks = np.array(
+                [k_lo, min(k_lo + 1, n_pos - 1), k_hi, min(k_hi + 1, n_pos - 1)]
+            )
+
+            # Values at the four (ascending) ranks in one cumulative walk
+            vals = np.zeros(4)
+            j = 0
+            cum = 0
+            for v in range(1, n_levels):
+                cum += counts[v]
+                while j < 4 and cum > ranks[j]:
+                    vals[j] = v
+                    j += 1
+                if j == 4:
+                    break
+
+            if interpolate:
+                out[c, 0] = vals[0] + (pos_lo - k_lo) * (vals[1] - vals[0])
+                out[c, 1] = vals[2] + (pos_hi - k_hi) * (vals[3] - vals[2])
+            else:
+                out[c, 0] = vals[0]
+                out[c, 1] = vals[2]
+        return out
+
+
+def auto_clim(cache, pct_low, pct_high, interpolate=False):
+    """
+    Percentile contrast limits of the non-zero pixels of each channel of a
+    (C, Y, X) uint8/uint16 slice, as a (C, 2) array of (lo, hi).
+    By default each limit is the order statistic at rank int(q * (n - 1));
+    with interpolate=True it matches np.percentile's linear interpolation.
+
+    Every pixel is counted into a per-channel histogram in one compiled
+    pass, parallel over channels. Returns None when numba is unavailable
+    or the dtype isn't supported, so callers can use their own path.
+    """
+    if not HAVE_NUMBA or cache.dtype not in (np.uint8, np.uint16):
+        return None
+    n_levels = 1 << (8 * cache.itemsize)
+    return _int_clims(
+        cache, n_levels, float(pct_low), float(pct_high), bool(interpolate)
+    )
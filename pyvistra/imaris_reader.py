@@ -1,4 +1,6 @@
+import math
 import re
+from collections import OrderedDict
 from datetime import datetime
 
 import h5py
@@ -23,9 +25,17 @@ class ImarisReader:
         read(c=0, t=0, z=None, res_level=0)
     """
 
+    # Most recently used (res_level, t, c) datasets kept open. Each one
+    # holds a chunk cache of about one XY plane of chunks, so this also
+    # caps the total cache memory
+    MAX_OPEN_DATASETS = 8
+
     def __init__(self, filepath):
         self.filepath = filepath
         self._file = h5py.File(filepath, "r")
+        # The chunk cache lives on the dataset handle, so handles are kept
+        # open between reads instead of being reopened for every plane
+        self._datasets = OrderedDict()
 
         # Initialize containers
         self.voxel_size = (1.0, 1.0, 1.0)
@@ -43,6 +53,7 @@ class ImarisReader:
         self.close()
 
     def close(self):
+        self._datasets.clear()
         if self._file:
             self._file.close()
             self._file = None
@@ -288,6 +299,28 @@ class ImarisReader:
             z: Z-slice index. None for full volume.
             res_level: Resolution level (0=Full).
         """
+        dataset = self._get_dataset(c, t, res_level)
+
+        # Read straight into preallocated arrays to skip h5py's intermediate
+        # copies; other z selections (e.g. slices) use regular indexing
+        if z is None:
+            out = np.empty(dataset.shape, dtype=dataset.dtype)
+            dataset.read_direct(out)
+        elif isinstance(z, (int, np.integer)):
+            out = np.empty(dataset.shape[1:], dtype=dataset.dtype)
+            dataset.read_direct(out, source_sel=np.s_[z, :, :])
+        else:
+            out = dataset[z, :, :]
+        return out
+
+    def _get_dataset(self, c, t, res_level):
+        """Return the open Data dataset for (res_level, t, c), LRU-cached."""
+        key = (res_level, t, c)
+        dataset = self._datasets.get(key)
+        if dataset is not None:
+            self._datasets.move_to_end(key)
+            return dataset
+
         if res_level >= self.resolution_levels:
             raise ValueError(f"Resolution level {res_level} unavailable.")
 
@@ -312,14 +345,44 @@ class ImarisReader:
             if not c_candidates:
                 raise ValueError(f"Channel {c} not found")
 
-            dataset = t_grp[c_candidates[0]]["Data"]
+            dataset = self._open_cached(t_grp[c_candidates[0]], "Data")
         except Exception as e:
             raise ValueError(f"Error locating data: {str(e)}")
 
-        if z is not None:
-            return dataset[z, :, :]
-        else:
-            return dataset[:]
+        self._datasets[key] = dataset
+        if len(self._datasets) > self.MAX_OPEN_DATASETS:
+            self._datasets.popitem(last=False)
+        return dataset
+
+    @staticmethod
+    def _open_cached(group, name):
+        """
+        Open a dataset with a chunk cache sized to hold every chunk of one
+        XY plane, so walking Z doesn't re-read and re-decompress chunks that
+        span several slices (h5py's default cache is 1 MB with 521 slots).
+        """
+        dataset = group[name]
+        chunks = dataset.chunks
+        if chunks is None or dataset.ndim < 2:
+            return dataset
+        shape, itemsize = dataset.shape, dataset.dtype.itemsize
+        # An already-open dataset ignores new access properties, so close
+        # this handle before reopening with the sized cache
+        dataset.id.close()
+        del dataset
+
+        n_chunks = math.ceil(shape[-2] / chunks[-2]) * math.ceil(
+            shape[-1] / chunks[-1]
+        )
+        chunk_nbytes = math.prod(chunks) * itemsize
+        # 25% headroom; ~100 hash slots per cached chunk, odd to spread keys
+        nbytes = int(n_chunks * chunk_nbytes * 1.25)
+        nslots = max(521, 100 * n_chunks) | 1
+
+        dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+        dapl.set_chunk_cache(nslots, nbytes, 0.75)
+        dsid = h5py.h5d.open(group.id, name.encode(), dapl=dapl)
+        return h5py.Dataset(dsid)
 
     def __repr__(self):
         return (
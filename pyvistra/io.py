@@ -1,6 +1,7 @@
 import os
 import shutil
 import uuid
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -283,7 +284,7 @@ class ImageBuffer:
     def save_as(self, filepath):
         """Export buffer to OME-TIFF."""
         scale = self.metadata.get('scale', (1.0, 1.0, 1.0))
-        save_tiff(filepath, self._store[:], scale=scale)
+        save_tiff(filepath, self._store, scale=scale)
 
     def close(self):
         """Close and delete the temporary buffer file."""
@@ -370,6 +371,23 @@ def apply_transform(source, rotation_deg, translate, metadata=None, progress_cb=
     return buffer
 
 
+@lru_cache(maxsize=None)
+def _dims_plan(dims):
+    """
+    Transpose/reshape plan for a lowercase dims string, computed once per
+    distinct string. Returns (perm, sources): perm orders the present axes
+    as t, z, c, y, x, and sources gives, for each of t, z, c, y, x, the
+    input axis supplying its size (or None for a new size-1 axis).
+    """
+    target_order = "tzcyx"
+    present_dims = [d for d in target_order if d in dims]
+    perm = tuple(dims.index(d) for d in present_dims)
+    sources = tuple(
+        dims.index(char) if char in dims else None for char in target_order
+    )
+    return perm, sources
+
+
 def normalize_to_5d(data, dims=None, rgb=None):
     """
     Normalizes a numpy array to (T, Z, C, Y, X) format.
@@ -400,20 +418,14 @@ def normalize_to_5d(data, dims=None, rgb=None):
             )
 
         # Target: t, z, c, y, x
-        target_order = ["t", "z", "c", "y", "x"]
-
-        present_dims = [d for d in target_order if d in dims]
-        perm = [dims.index(d) for d in present_dims]
+        perm, sources = _dims_plan(dims)
 
         final_img = np.transpose(data, perm)
 
         # Calculate target shape
-        target_shape = []
-        for char in target_order:
-            if char in dims:
-                target_shape.append(data.shape[dims.index(char)])
-            else:
-                target_shape.append(1)
+        target_shape = [
+            1 if src is None else data.shape[src] for src in sources
+        ]
 
         final_img = final_img.reshape(target_shape)
 
@@ -582,19 +594,6 @@ def save_tiff(filepath, data, scale=(1.0, 1.0, 1.0), axes="TZCYX", input_axes=No
         # Save with channel dimension
         save_tiff("out.tif", multichannel, input_axes="CZYX")
     """
-    # Ensure data is numpy array (loads into memory)
-    # If it's a proxy, slicing [:] triggers reading.
-    # We use np.asarray to avoid copying if it's already an array
-    try:
-        image = np.asarray(data[:])
-    except TypeError:
-        # Fallback if slicing not supported directly or data is list
-        image = np.asarray(data)
-
-    # Normalize to 5D if input_axes is specified
-    if input_axes is not None:
-        image = normalize_to_5d(image, dims=input_axes).array
-
     sz, sy, sx = scale
 
     # Resolution (pixels per unit)
@@ -609,6 +608,42 @@ def save_tiff(filepath, data, scale=(1.0, 1.0, 1.0), axes="TZCYX", input_axes=No
         "unit": "um",
     }
 
+    # 5D proxies/stores (e.g. ImageBuffer's zarr store) are streamed one
+    # timepoint at a time into a memory-mapped TIFF, so the full stack is
+    # never held in RAM
+    if (
+        input_axes is None
+        and not isinstance(data, np.ndarray)
+        and hasattr(data, "dtype")
+        and len(getattr(data, "shape", ())) == 5
+    ):
+        out = tifffile.memmap(
+            filepath,
+            shape=data.shape,
+            dtype=data.dtype,
+            imagej=True,
+            resolution=(rx, ry),
+            metadata=metadata,
+        )
+        for t in range(data.shape[0]):
+            out[t] = data[t, :, :, :, :]
+        out.flush()
+        del out
+        return
+
+    # Ensure data is numpy array (loads into memory)
+    # If it's a proxy, slicing [:] triggers reading.
+    # We use np.asarray to avoid copying if it's already an array
+    try:
+        image = np.asarray(data[:])
+    except TypeError:
+        # Fallback if slicing not supported directly or data is list
+        image = np.asarray(data)
+
+    # Normalize to 5D if input_axes is specified
+    if input_axes is not None:
+        image = normalize_to_5d(image, dims=input_axes).array
+
     tifffile.imwrite(
         filepath, image, imagej=True, resolution=(rx, ry), metadata=metadata
     )
@@ -56,6 +56,9 @@ class OrthoVisualProxy:
     def get_gamma(self, channel_idx):
         return self.primary.get_gamma(channel_idx)
 
+    def get_preview_u8(self, channel_idx, step=1):
+        return self.primary.get_preview_u8(channel_idx, step)
+
     def set_mode(self, mode):
         for v in self.visuals:
             v.set_mode(mode)
@@ -78,6 +81,9 @@ class OrthoVisualProxy:
     def get_channel_visible(self, channel_idx):
         return self.primary.get_channel_visible(channel_idx)
 
+    def visibility_mask(self):
+        return self.primary.visibility_mask()
+
 
 class TransposedProxy:
     """
@@ -435,13 +435,18 @@ class ROIManager(QWidget):
         if count > 0:
             self.active_window.canvas.update()
 
-    def run_analysis(self, func):
-        item = self.roi_list.currentItem()
-        if not item or not self.active_window:
+    def run_analysis(self, func, roi=None):
+        """Run an analysis function on an ROI of the active window.
+
+        Uses the ROI selected in the list unless one is passed explicitly.
+        """
+        if roi is None:
+            item = self.roi_list.currentItem()
+            if item:
+                roi = item.data(Qt.UserRole)
+        if roi is None or not self.active_window:
             print("No ROI selected")
             return
-            
-        roi = item.data(Qt.UserRole)
         
         # Prepare Data
         # For profile/measure, we usually want the CURRENT slice (2D)
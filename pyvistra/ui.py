@@ -1,6 +1,7 @@
 import heapq
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from natsort import natsort_key
@@ -56,7 +57,9 @@ class ImageWindow(QMainWindow):
     roi_removed = Signal(object)  # Emits the ROI that was removed
     roi_selection_changed = Signal(object)  # Emits the selected ROI (or None)
 
-    def __init__(self, data_or_path, title="Image", meta=None):
+    def __init__(
+        self, data_or_path, title="Image", meta=None, filepath=None, first_slice=None
+    ):
         super().__init__()
         self.setAttribute(Qt.WA_DeleteOnClose)
 
@@ -66,7 +69,8 @@ class ImageWindow(QMainWindow):
             self.img_data, self.meta = load_image(self.filepath)
             filename = self.meta.get("filename", "Image")
         else:
-            self.filepath = None
+            # filepath is set when the data was already loaded from a file
+            self.filepath = filepath
             self.meta = meta or {}
 
             # Accept any 5D proxy-like object (Imaris5DProxy, Numpy5DProxy, etc.)
@@ -173,8 +177,14 @@ class ImageWindow(QMainWindow):
         # Focus policy
         self.setFocusPolicy(Qt.StrongFocus)
 
-        # Initial Draw
-        self.update_view()
+        # Initial Draw (reusing the (t=0, z=0) slice if it was read already)
+        if first_slice is not None:
+            self.renderer.update_slice(
+                self.t_idx, self.z_idx, volume_slice=first_slice
+            )
+            self.canvas.update()
+        else:
+            self.update_view()
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -650,7 +660,32 @@ class ImageWindow(QMainWindow):
             self.start_pos = None
 
 
+def _load_for_display(filepath):
+    """
+    Open an image file and read the slice shown first, off the GUI thread.
+    h5py releases the GIL while reading, so the read of the initial
+    (t=0, z=0) slice overlaps with the GUI. The slice is copied into memory
+    (for memory-mapped TIFFs indexing alone reads nothing) and handed to
+    the window, which draws it without reading it again.
+    """
+    data, meta = load_image(filepath)
+    return data, meta, np.array(data[0, 0])
+
+
+def _close_data(data):
+    """Release the file handle behind a loaded image, if it has one."""
+    if hasattr(data, "close"):
+        try:
+            data.close()
+        except Exception:
+            pass
+
+
 class Toolbar(QMainWindow):
+    # Emitted from the loader thread, delivered queued on the GUI thread
+    file_loaded = Signal(str, object, object, object)  # filepath, data, meta, slice
+    file_load_failed = Signal(str, str)  # filepath, error message
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("pyvistra v0.1 (prototype)")
@@ -658,6 +693,14 @@ class Toolbar(QMainWindow):
         self.setAcceptDrops(True)
         self.open_windows = []
 
+        # Files are opened on a background thread; windows are built on the
+        # GUI thread once the data is ready
+        self._loader = ThreadPoolExecutor(max_workers=1)
+        self._pending_loads = set()
+        self._closed = False
+        self.file_loaded.connect(self._on_file_loaded)
+        self.file_load_failed.connect(self._on_file_load_failed)
+
         # Central Widget with Layout
         central = QWidget()
         self.setCentralWidget(central)
@@ -817,6 +860,13 @@ class Toolbar(QMainWindow):
         for w in windows:
             w.close()
 
+        # Queued loads are dropped; a load already running finishes and its
+        # data is closed instead of being shown
+        self._closed = True
+        for future in list(self._pending_loads):
+            future.cancel()
+        self._loader.shutdown(wait=False)
+
         # Quit Vispy's app to ensure clean OpenGL context shutdown
         try:
             app.quit()
@@ -826,13 +876,49 @@ class Toolbar(QMainWindow):
         super().closeEvent(event)
 
     def spawn_viewer(self, filepath):
+        """Load filepath in the background and open it in a new window."""
+        future = self._loader.submit(_load_for_display, filepath)
+        self._pending_loads.add(future)
+        future.add_done_callback(lambda f: self._emit_load_result(filepath, f))
+
+    def _emit_load_result(self, filepath, future):
+        # Runs on the loader thread (or the GUI thread for a cancelled load):
+        # hand the result over via queued signals
+        self._pending_loads.discard(future)
+        if future.cancelled():
+            return
         try:
-            viewer = ImageWindow(filepath)
+            data, meta, first_slice = future.result()
+        except Exception as e:
+            try:
+                self.file_load_failed.emit(filepath, str(e))
+            except RuntimeError:
+                pass  # Toolbar was deleted while the file was loading
+            return
+        try:
+            self.file_loaded.emit(filepath, data, meta, first_slice)
+        except RuntimeError:
+            # Toolbar was deleted while the file was loading
+            _close_data(data)
+
+    def _on_file_loaded(self, filepath, data, meta, first_slice):
+        if self._closed:
+            # Toolbar was closed while the file was loading
+            _close_data(data)
+            return
+        try:
+            viewer = ImageWindow(
+                data, meta=meta, filepath=filepath, first_slice=first_slice
+            )
             viewer.show()
             self.open_windows.append(viewer)
         except Exception as e:
+            _close_data(data)
             print(f"Error opening {filepath}: {e}")
 
+    def _on_file_load_failed(self, filepath, message):
+        print(f"Error opening {filepath}: {message}")
+
 
 def imshow(data, meta_or_title=None, dims=None, *, title=None):
     """
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import matplotlib.cm as mpl_cm
 import numpy as np
 from vispy import scene
@@ -54,8 +56,12 @@ DEFAULT_CHANNEL_COLORMAPS = [
 RGB_COLORMAPS = ["Red", "Pure Green", "Blue"]
 
 
+@lru_cache(maxsize=64)
 def get_colormap(name):
-    """Get a vispy Colormap by name from COLORMAPS dictionary."""
+    """
+    Get a vispy Colormap by name from COLORMAPS dictionary.
+    Results are cached, so the returned Colormap must not be modified.
+    """
     if name not in COLORMAPS:
         # Fallback to white if unknown
         return Colormap(["black", "white"]), "white"
@@ -70,6 +76,26 @@ def get_colormap(name):
         return Colormap(spec), spec[1]  # Return colormap and end color
 
 
+def center_rotation_matrix(sx, sy, cx, cy, rot_deg, tx, ty):
+    """
+    Closed-form 4x4 matrix for: scale by (sx, sy), rotate by rot_deg
+    around (cx, cy), then translate by (tx, ty).
+
+    Equivalent to T_back @ R @ T_to_origin @ S, laid out for VisPy's
+    row-vector convention (points are multiplied as p @ matrix).
+    """
+    theta = np.radians(rot_deg)
+    c, s = np.cos(theta), np.sin(theta)
+    return np.array(
+        [
+            [sx * c, sx * s, 0.0, 0.0],
+            [-sy * s, sy * c, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [cx - cx * c + cy * s + tx, cy - cx * s - cy * c + ty, 0.0, 1.0],
+        ]
+    )
+
+
 class CompositeImageVisual:
     """
     Manages multiple Vispy Image visuals to create a composite
@@ -88,6 +114,7 @@ class CompositeImageVisual:
         self.active_channel_idx = 0
 
         self.current_slice_cache = None
+        self._preview_u8 = {}  # (channel, step) -> uint8 plane over clim
         self.channel_clims = {}
         self.channel_gammas = {}
         self.channel_colormaps = {}  # Maps channel index to colormap name
@@ -177,11 +204,20 @@ class CompositeImageVisual:
         self.active_channel_idx = idx
         self._update_visibility()
 
+    def visibility_mask(self):
+        """Per-channel visibility toggles as a bool array, one per layer."""
+        return np.fromiter(
+            (self.channel_visibility.get(i, True) for i in range(len(self.layers))),
+            dtype=bool,
+            count=len(self.layers),
+        )
+
     def _update_visibility(self):
+        mask = self.visibility_mask()
         for i, layer in enumerate(self.layers):
             if self.mode == "composite":
                 # In composite mode, respect per-channel visibility toggle
-                layer.visible = self.channel_visibility.get(i, True)
+                layer.visible = bool(mask[i])
                 layer.set_gl_state(
                     blend=True,
                     blend_func=("one", "one"),
@@ -191,12 +227,14 @@ class CompositeImageVisual:
                 # In single channel mode, only show active channel
                 layer.visible = i == self.active_channel_idx
 
-    def update_slice(self, t_idx, z_idx):
-        try:
-            volume_slice = self.data[t_idx, z_idx, :, :, :]
-        except Exception as e:
-            print(f"Error slicing data: {e}")
-            return
+    def update_slice(self, t_idx, z_idx, volume_slice=None):
+        # volume_slice: data[t_idx, z_idx] when the caller already read it
+        if volume_slice is None:
+            try:
+                volume_slice = self.data[t_idx, z_idx, :, :, :]
+            except Exception as e:
+                print(f"Error slicing data: {e}")
+                return
 
         # Handle Z-Stack Projection
         # If z_idx is a slice, volume_slice will be (Z, C, Y, X) or (Z, Y, X)
@@ -213,6 +251,7 @@ class CompositeImageVisual:
             volume_slice = volume_slice[np.newaxis, :, :]
 
         self.current_slice_cache = volume_slice
+        self._preview_u8.clear()
 
         for c, layer in enumerate(self.layers):
             if c < volume_slice.shape[0]:
@@ -248,6 +287,34 @@ class CompositeImageVisual:
         if channel_idx < len(self.layers):
             self.layers[channel_idx].clim = (vmin, vmax)
             self.channel_clims[channel_idx] = (vmin, vmax)
+            self._preview_u8 = {
+                k: v for k, v in self._preview_u8.items()
+                if k[0] != channel_idx
+            }
+
+    def get_preview_u8(self, channel_idx, step=1):
+        """
+        Current plane of a channel quantized to uint8 over its clim, taking
+        every `step`-th pixel. Cached until the slice or clim changes, so
+        consumers that only display the plane can share a 1-byte copy.
+        """
+        key = (channel_idx, step)
+        preview = self._preview_u8.get(key)
+        if preview is None:
+            plane = self.current_slice_cache[channel_idx, ::step, ::step]
+            vmin, vmax = self.get_clim(channel_idx)
+            scale = 255.0 / max(vmax - vmin, 1e-12)
+            # Remove the offset before narrowing to float32 so that float64
+            # or int32 data with a large offset keeps its levels
+            scaled = np.subtract(
+                plane, vmin, dtype=np.promote_types(plane.dtype, np.float32)
+            ).astype(np.float32, copy=False)
+            scaled *= np.float32(scale)
+            np.nan_to_num(scaled, copy=False, nan=0.0)
+            np.clip(scaled, 0, 255, out=scaled)
+            preview = scaled.astype(np.uint8)
+            self._preview_u8[key] = preview
+        return preview
 
     def get_clim(self, channel_idx):
         return self.channel_clims.get(channel_idx, (0, 255))
@@ -336,18 +403,11 @@ class CompositeImageVisual:
         # 4. Translate back + user offset
         #
         # Matrix form: T_back @ R @ T_to_origin @ S
-        #
-        # VisPy's methods do: self.matrix = self.matrix @ new_transform
-        # So we build left-to-right to get the correct composition
-        transform = MatrixTransform()
-        transform.scale((sx, sy, 1))
-        transform.translate((-cx, -cy, 0))
-        transform.rotate(self._rotation_deg, (0, 0, 1))
-        transform.translate(
-            (cx + self._translate_x, cy + self._translate_y, 0)
+        matrix = center_rotation_matrix(
+            sx, sy, cx, cy,
+            self._rotation_deg, self._translate_x, self._translate_y,
         )
-
-        return transform
+        return MatrixTransform(matrix)
 
     def _apply_transform_to_layers(self):
         """Apply the current transform to all image layers."""
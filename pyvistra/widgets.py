@@ -1,5 +1,7 @@
+from contextlib import contextmanager
+
 import numpy as np
-from qtpy.QtCore import QRectF, Qt, Signal
+from qtpy.QtCore import QRectF, Qt, QTimer, Signal
 from qtpy.QtGui import QBrush, QColor, QFont, QPainter, QPen
 from qtpy.QtWidgets import (
     QCheckBox,
@@ -14,14 +16,189 @@ from qtpy.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from vispy import scene
+from vispy.visuals.transforms.linear import MatrixTransform, STTransform
 
-from pyvistra.visuals import COLORMAPS
+from pyvistra.visuals import COLORMAPS, center_rotation_matrix, get_colormap
 
 # Theme Constants
 WIDGET_BG = QColor(32, 32, 32)
 TEXT_COLOR = QColor(224, 224, 224)
 HANDLE_COLOR = QColor(255, 255, 255)
 HANDLE_WIDTH = 6
+OVERLAY_COLOR = QColor(0, 0, 0, 150)
+
+# Largest overlay texture side; bigger query planes are strided down
+OVERLAY_MAX_SIZE = 2048
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block Qt signals from widgets within the block, then restore them."""
+    previous = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(widgets, previous):
+            w.blockSignals(was_blocked)
+
+
+def _coalescing_timer(parent, slot):
+    """
+    Single-shot ~60 Hz timer: restarting it during a burst of control
+    changes runs slot once, after the burst.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(16)
+    timer.timeout.connect(slot)
+    return timer
+
+
+# Precomputed log1p for histogram counts; larger counts fall back to np.log1p
+_LOG1P_LUT = np.log1p(np.arange(1 << 16, dtype=np.float64))
+
+
+def _log_counts(counts):
+    """Return log1p of integer histogram counts using a lookup table."""
+    log_counts = _LOG1P_LUT[np.minimum(counts, _LOG1P_LUT.size - 1)]
+    overflow = counts >= _LOG1P_LUT.size
+    if overflow.any():
+        log_counts[overflow] = np.log1p(counts[overflow])
+    return log_counts
+
+
+# Upper bound on pixels binned per display histogram
+HISTOGRAM_SAMPLES = 1_000_000
+
+
+def _histogram_counts(data_slice, lo, hi, n_bins=100):
+    """
+    Uniform-bin histogram of data_slice over [lo, hi] (n_bins <= 256).
+    The plane is quantized straight to uint8 bin indices and counted with
+    np.bincount, skipping the bin-edge search done by np.histogram. The
+    offset is removed in at least the input's precision and only the
+    result is narrowed to float32, so large offsets don't collapse bins.
+    Planes above HISTOGRAM_SAMPLES pixels are binned with a uniform stride
+    s on both axes and the counts scaled by s * s, which keeps the shape
+    of the display histogram while bounding the work per plane.
+    """
+    step = 1
+    if data_slice.ndim == 2 and data_slice.size > HISTOGRAM_SAMPLES:
+        step = int(np.sqrt(data_slice.size / HISTOGRAM_SAMPLES))
+        data_slice = data_slice[::step, ::step]
+    flat = np.ravel(data_slice)
+    if flat.dtype.kind == "f":
+        flat = flat[np.isfinite(flat)]
+    scaled = np.subtract(
+        flat, lo, dtype=np.promote_types(flat.dtype, np.float32)
+    ).astype(np.float32, copy=False)
+    scaled *= np.float32(n_bins / (hi - lo))
+    np.clip(scaled, 0, n_bins - 1, out=scaled)
+    counts = np.bincount(scaled.astype(np.uint8), minlength=n_bins)
+    if step > 1:
+        counts *= step * step
+    return counts
+
+
+def _fast_hist(data_slice, n_bins=100):
+    """
+    Display histogram of a plane over its own data range.
+    Returns (counts, data_min, data_max) so that callers can hand the small
+    counts array to a histogram widget instead of the full plane.
+    """
+    if data_slice.dtype.kind == "f":
+        data_min = float(np.nanmin(data_slice))
+        data_max = float(np.nanmax(data_slice))
+    else:
+        data_min = float(data_slice.min())
+        data_max = float(data_slice.max())
+
+    if data_max <= data_min:
+        data_max = data_min + 1e-5
+
+    counts = _histogram_counts(data_slice, data_min, data_max, n_bins)
+    return counts, data_min, data_max
+
+
+def _fast_int_percentile(plane, pct_low, pct_high):
+    """
+    Percentiles of the non-zero pixels of a uint8/uint16 plane.
+    Uses a counting histogram and its cumulative sum instead of sorting,
+    so the plane is never promoted to float. Matches np.percentile's
+    linear interpolation. Returns None if the plane is all zeros.
+    """
+    counts = np.bincount(plane.ravel(), minlength=1 << (8 * plane.itemsize))
+    counts[0] = 0  # Ignore zeros (background)
+    cum = np.cumsum(counts)
+    n = cum[-1]
+    if n == 0:
+        return None
+
+    pos = np.array([pct_low, pct_high]) / 100.0 * (n - 1)
+    k = np.floor(pos)
+    v_lo = np.searchsorted(cum, k, side="right")
+    v_hi = np.searchsorted(cum, np.minimum(k + 1, n - 1), side="right")
+    mn, mx = v_lo + (pos - k) * (v_hi - v_lo)
+    return float(mn), float(mx)
+
+
+# Upper bound on pixels read per channel by strided auto-contrast
+AUTO_CONTRAST_SAMPLES = 1_000_000
+
+
+def _robust_clim(plane, pct_low, pct_high):
+    """
+    Percentile limits of a 2D plane, ignoring zeros (background).
+    Large planes are subsampled with a uniform stride so that at most
+    ~AUTO_CONTRAST_SAMPLES pixels are read, and the order statistics are
+    found with np.partition (O(n) quickselect) instead of a full sort.
+    Rather than gathering the positive pixels, the ranks are offset past
+    the non-positive ones, which always sort first (NaNs sort last).
+    """
+    step = max(1, int(np.sqrt(plane.size / AUTO_CONTRAST_SAMPLES)))
+    flat = plane[::step, ::step].flatten()
+
+    if flat.dtype.kind == "u":
+        # Unsigned: positive means non-zero, counted without a mask array
+        n_pos = np.count_nonzero(flat)
+        offset = flat.size - n_pos
+    else:
+        n_pos = np.count_nonzero(flat > 0)
+        offset = np.count_nonzero(flat <= 0) if n_pos else 0
+    if not n_pos:
+        offset, n_pos = 0, flat.size
+
+    k_lo = offset + int(pct_low / 100.0 * (n_pos - 1))
+    k_hi = offset + int(pct_high / 100.0 * (n_pos - 1))
+    flat.partition([k_lo, k_hi])
+    return float(flat[k_lo]), float(flat[k_hi])
+
+
+def _kernel_clims(cache, pct_low, pct_high, interpolate=False):
+    """
+    Limits from the compiled full-histogram kernel (pyvistra._fast), only
+    for planes above AUTO_CONTRAST_SAMPLES pixels, which the NumPy path
+    would subsample. Smaller slices never import numba or compile the
+    kernel, which costs seconds the first time. Returns None otherwise.
+    """
+    if cache.shape[-2] * cache.shape[-1] <= AUTO_CONTRAST_SAMPLES:
+        return None
+    from pyvistra._fast import auto_clim
+
+    return auto_clim(cache, pct_low, pct_high, interpolate=interpolate)
+
+
+def _channel_clims(cache, pct_low, pct_high):
+    """
+    Robust (lo, hi) limits for each channel of a (C, Y, X) slice.
+    Large integer slices use the compiled full-histogram kernel when numba
+    is available; everything else goes through _robust_clim per channel.
+    """
+    clims = _kernel_clims(cache, pct_low, pct_high)
+    if clims is None:
+        return [_robust_clim(plane, pct_low, pct_high) for plane in cache]
+    return [(float(lo), float(hi)) for lo, hi in clims]
 
 
 class HistogramWidget(QWidget):
@@ -52,23 +229,36 @@ class HistogramWidget(QWidget):
         self._dragging = None  # 'min', 'max', 'center', or None
         self._last_mouse_x = 0
 
-    def set_data(self, data_slice, color_name):
-        # 1. Compute Histogram
-        # We use a fixed number of bins for display
-        self.data_min = float(np.nanmin(data_slice))
-        self.data_max = float(np.nanmax(data_slice))
+        # Painting tools, reused across paints
+        self._fill_brush = QBrush()
+        self._set_fill_color(self.color)
+        self._handle_pen = QPen(HANDLE_COLOR)
+        self._handle_pen.setWidth(2)
 
-        if self.data_max <= self.data_min:
-            self.data_max = self.data_min + 1e-5
+        # Paint caches (label widths only change with the label text)
+        self._font = QFont()
+        self._label_widths = None  # (min_str, max_str, tw_min, tw_max)
 
-        y, x = np.histogram(
-            data_slice, bins=100, range=(self.data_min, self.data_max)
-        )
-        self.hist_data = np.log1p(y)
+    def set_data(self, data_slice, color_name):
+        counts, data_min, data_max = _fast_hist(data_slice)
+        self.set_histogram(counts, data_min, data_max, color_name)
+
+    def set_histogram(self, counts, data_min, data_max, color_name):
+        """Display precomputed histogram counts spanning [data_min, data_max]."""
+        self.data_min = data_min
+        self.data_max = data_max
+        self.hist_data = _log_counts(counts)
 
         self.color = QColor(color_name)
+        self._set_fill_color(self.color)
         self.update()
 
+    def _set_fill_color(self, color):
+        fill_color = QColor(color)
+        fill_color.setAlpha(100)
+        self._fill_brush.setColor(fill_color)
+        self._fill_brush.setStyle(Qt.SolidPattern)
+
     def set_clim(self, vmin, vmax):
         self.clim_min = vmin
         self.clim_max = vmax
@@ -105,9 +295,7 @@ class HistogramWidget(QWidget):
             if max_log == 0:
                 max_log = 1
 
-            fill_color = QColor(self.color)
-            fill_color.setAlpha(100)
-            painter.setBrush(QBrush(fill_color))
+            painter.setBrush(self._fill_brush)
             painter.setPen(Qt.NoPen)
 
             n_bins = len(self.hist_data)
@@ -123,14 +311,11 @@ class HistogramWidget(QWidget):
         x_min = self._val_to_x(self.clim_min)
         x_max = self._val_to_x(self.clim_max)
 
-        dark_overlay = QColor(0, 0, 0, 150)
-        painter.fillRect(0, 0, x_min, h, dark_overlay)
-        painter.fillRect(x_max, 0, w - x_max, h, dark_overlay)
+        painter.fillRect(0, 0, x_min, h, OVERLAY_COLOR)
+        painter.fillRect(x_max, 0, w - x_max, h, OVERLAY_COLOR)
 
         # 3. Draw Handles
-        pen = QPen(HANDLE_COLOR)
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._handle_pen)
 
         # Min Handle
         painter.drawLine(x_min, 0, x_min, h)
@@ -139,17 +324,25 @@ class HistogramWidget(QWidget):
 
         # 4. Text Labels
         painter.setPen(TEXT_COLOR)
-        font = QFont()
-        painter.setFont(font)
+        painter.setFont(self._font)
 
         # Draw min/max values at handles
         min_str = f"{self.clim_min:.1f}"
         max_str = f"{self.clim_max:.1f}"
 
         # Adjust text position to stay on screen
-        fm = painter.fontMetrics()
-        tw_min = fm.width(min_str)
-        tw_max = fm.width(max_str)
+        if self._label_widths is None or self._label_widths[:2] != (
+            min_str,
+            max_str,
+        ):
+            fm = painter.fontMetrics()
+            self._label_widths = (
+                min_str,
+                max_str,
+                fm.width(min_str),
+                fm.width(max_str),
+            )
+        tw_min, tw_max = self._label_widths[2:]
 
         draw_x_min = max(2, min(x_min - tw_min - 2, w - tw_min - 2))
         draw_x_max = min(w - tw_max - 2, max(x_max + 2, 2))
@@ -364,6 +557,11 @@ class ContrastDialog(QDialog):
         # State for auto-contrast
         self.pct_low = 0.2
         self.pct_high = 99.98
+        self._scratch = None  # Reused buffer for non-zero pixels
+
+        # Per-channel histograms of the current slice, keyed by channel
+        self._hist_source = None
+        self._hists = {}
 
         # Initial Load
         self.refresh_ui()
@@ -375,8 +573,6 @@ class ContrastDialog(QDialog):
             return
 
         if c_idx < cache.shape[0]:
-            plane = cache[c_idx]
-
             # Update Colormap Dropdown
             cmap_name = self.viewer.renderer.get_colormap_name(c_idx)
             self.cmap_combo.blockSignals(True)
@@ -387,7 +583,7 @@ class ContrastDialog(QDialog):
 
             # Update Histogram Data
             color = self.viewer.renderer.channel_colors[c_idx % 6]
-            self.hist_widget.set_data(plane, color)
+            self.hist_widget.set_histogram(*self._channel_hist(cache, c_idx), color)
 
             # Get current clim from renderer
             curr_min, curr_max = self.viewer.renderer.get_clim(c_idx)
@@ -406,6 +602,15 @@ class ContrastDialog(QDialog):
             self.gamma_slider.setValue(int(gamma * 100))
             self.block_gamma_signals(False)
 
+    def _channel_hist(self, cache, c_idx):
+        """Histogram of one channel of the slice, computed once per slice."""
+        if cache is not self._hist_source:
+            self._hist_source = cache
+            self._hists = {}
+        if c_idx not in self._hists:
+            self._hists[c_idx] = _fast_hist(cache[c_idx])
+        return self._hists[c_idx]
+
     def block_clim_signals(self, block):
         """Block or unblock signals from clim-related widgets."""
         self.hist_widget.blockSignals(block)
@@ -483,7 +688,7 @@ class ContrastDialog(QDialog):
         color = self.viewer.renderer.channel_colors[c_idx % 6]
         cache = self.viewer.renderer.current_slice_cache
         if cache is not None and c_idx < cache.shape[0]:
-            self.hist_widget.set_data(cache[c_idx], color)
+            self.hist_widget.set_histogram(*self._channel_hist(cache, c_idx), color)
 
     def reset_auto_contrast(self):
         """Reset to default robust percentiles."""
@@ -511,25 +716,62 @@ class ContrastDialog(QDialog):
 
         self.apply_auto_contrast()
 
+    def _auto_limits(self, plane):
+        """
+        Percentile limits of a plane, ignoring zeros (background).
+        Non-zero pixels are gathered into a scratch buffer that is reused
+        across channels and calls instead of allocating plane[plane > 0].
+        uint8/uint16 planes take a counting fast path with no float copy.
+        Other planes above AUTO_CONTRAST_SAMPLES pixels are read with a
+        uniform stride s = int(sqrt(size / AUTO_CONTRAST_SAMPLES)) on both
+        axes, i.e. 1 in s**2 pixels (1/16 for a 4096 x 4096 plane).
+        """
+        if plane.dtype in (np.uint8, np.uint16):
+            limits = _fast_int_percentile(plane, self.pct_low, self.pct_high)
+            if limits is not None:
+                return limits
+
+        if plane.size > AUTO_CONTRAST_SAMPLES:
+            step = int(np.sqrt(plane.size / AUTO_CONTRAST_SAMPLES))
+            plane = plane[::step, ::step]
+
+        flat = plane.ravel()
+        mask = flat > 0
+        n_valid = np.count_nonzero(mask)
+        if n_valid == 0:
+            # Fallback if all zeros
+            mn, mx = np.nanpercentile(flat, (self.pct_low, self.pct_high))
+            return float(mn), float(mx)
+
+        if (
+            self._scratch is None
+            or self._scratch.size < flat.size
+            or self._scratch.dtype != flat.dtype
+        ):
+            self._scratch = np.empty(flat.size, dtype=flat.dtype)
+        valid_data = np.compress(mask, flat, out=self._scratch[:n_valid])
+
+        mn, mx = np.nanpercentile(
+            valid_data, (self.pct_low, self.pct_high), overwrite_input=True
+        )
+        return float(mn), float(mx)
+
     def apply_auto_contrast(self):
         c_idx = self.combo.currentIndex()
         cache = self.viewer.renderer.current_slice_cache
 
         if self.chk_all_channels.isChecked():
-            # Apply to all channels
-            for ch_idx in range(self.combo.count()):
-                plane = cache[ch_idx]
-                # Ignore zeros (background)
-                valid_data = plane[plane > 0]
-                if valid_data.size == 0:
-                    valid_data = plane  # Fallback if all zeros
-
-                mn, mx = map(
-                    float,
-                    np.nanpercentile(
-                        valid_data, (self.pct_low, self.pct_high)
-                    ),
-                )
+            # Apply to all channels; large integer slices are histogrammed
+            # in one parallel pass when numba is available
+            n = self.combo.count()
+            clims = _kernel_clims(
+                cache[:n], self.pct_low, self.pct_high, interpolate=True
+            )
+            for ch_idx in range(n):
+                if clims is not None and clims[ch_idx, 1] > 0:
+                    mn, mx = (float(v) for v in clims[ch_idx])
+                else:
+                    mn, mx = self._auto_limits(cache[ch_idx])
 
                 # Update Renderer
                 self.viewer.renderer.set_clim(ch_idx, mn, mx)
@@ -545,16 +787,7 @@ class ContrastDialog(QDialog):
             return
 
         if cache is not None:
-            plane = cache[c_idx]
-            # Ignore zeros (background)
-            valid_data = plane[plane > 0]
-            if valid_data.size == 0:
-                valid_data = plane  # Fallback if all zeros
-
-            mn, mx = map(
-                float,
-                np.nanpercentile(valid_data, (self.pct_low, self.pct_high)),
-            )
+            mn, mx = self._auto_limits(cache[c_idx])
 
             # Update Renderer
             self.viewer.renderer.set_clim(c_idx, mn, mx)
@@ -606,21 +839,32 @@ class CompactHistogramWidget(QWidget):
         self._dragging = None  # 'min', 'max', 'center', or None
         self._last_mouse_x = 0
 
-    def set_data(self, data_slice, color_name):
-        self.data_min = float(np.nanmin(data_slice))
-        self.data_max = float(np.nanmax(data_slice))
+        # Painting tools, reused across paints
+        self._fill_brush = QBrush()
+        self._set_fill_color(self.color)
+        self._handle_pen = QPen(HANDLE_COLOR)
+        self._handle_pen.setWidth(2)
 
-        if self.data_max <= self.data_min:
-            self.data_max = self.data_min + 1e-5
+    def set_data(self, data_slice, color_name):
+        counts, data_min, data_max = _fast_hist(data_slice)
+        self.set_histogram(counts, data_min, data_max, color_name)
 
-        y, x = np.histogram(
-            data_slice, bins=100, range=(self.data_min, self.data_max)
-        )
-        self.hist_data = np.log1p(y)
+    def set_histogram(self, counts, data_min, data_max, color_name):
+        """Display precomputed histogram counts spanning [data_min, data_max]."""
+        self.data_min = data_min
+        self.data_max = data_max
+        self.hist_data = _log_counts(counts)
 
         self.color = QColor(color_name)
+        self._set_fill_color(self.color)
         self.update()
 
+    def _set_fill_color(self, color):
+        fill_color = QColor(color)
+        fill_color.setAlpha(100)
+        self._fill_brush.setColor(fill_color)
+        self._fill_brush.setStyle(Qt.SolidPattern)
+
     def set_clim(self, vmin, vmax):
         self.clim_min = vmin
         self.clim_max = vmax
@@ -656,9 +900,7 @@ class CompactHistogramWidget(QWidget):
             if max_log == 0:
                 max_log = 1
 
-            fill_color = QColor(self.color)
-            fill_color.setAlpha(100)
-            painter.setBrush(QBrush(fill_color))
+            painter.setBrush(self._fill_brush)
             painter.setPen(Qt.NoPen)
 
             n_bins = len(self.hist_data)
@@ -674,14 +916,11 @@ class CompactHistogramWidget(QWidget):
         x_min = self._val_to_x(self.clim_min)
         x_max = self._val_to_x(self.clim_max)
 
-        dark_overlay = QColor(0, 0, 0, 150)
-        painter.fillRect(0, 0, x_min, h, dark_overlay)
-        painter.fillRect(x_max, 0, w - x_max, h, dark_overlay)
+        painter.fillRect(0, 0, x_min, h, OVERLAY_COLOR)
+        painter.fillRect(x_max, 0, w - x_max, h, OVERLAY_COLOR)
 
         # Draw Handles (thinner for compact view)
-        pen = QPen(HANDLE_COLOR)
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._handle_pen)
         painter.drawLine(x_min, 0, x_min, h)
         painter.drawLine(x_max, 0, x_max, h)
 
@@ -914,32 +1153,30 @@ class ChannelRow(QWidget):
 
     def set_data(self, data_slice, color):
         """Update histogram data and color."""
+        counts, data_min, data_max = _fast_hist(data_slice)
+        self.set_histogram(counts, data_min, data_max, color)
+
+    def set_histogram(self, counts, data_min, data_max, color):
+        """Update color and histogram from precomputed counts."""
         self._update_color_swatch(color)
-        self.histogram.set_data(data_slice, color)
+        self.histogram.set_histogram(counts, data_min, data_max, color)
 
     def set_clim(self, vmin, vmax):
         """Update contrast limits display (histogram and spinboxes)."""
-        self.histogram.blockSignals(True)
-        self.min_spin.blockSignals(True)
-        self.max_spin.blockSignals(True)
-        self.histogram.set_clim(vmin, vmax)
-        self.min_spin.setValue(vmin)
-        self.max_spin.setValue(vmax)
-        self.histogram.blockSignals(False)
-        self.min_spin.blockSignals(False)
-        self.max_spin.blockSignals(False)
+        with _signals_blocked(self.histogram, self.min_spin, self.max_spin):
+            self.histogram.set_clim(vmin, vmax)
+            self.min_spin.setValue(vmin)
+            self.max_spin.setValue(vmax)
 
     def set_visible_state(self, visible):
         """Update checkbox state without emitting signal."""
-        self.chk_visible.blockSignals(True)
-        self.chk_visible.setChecked(visible)
-        self.chk_visible.blockSignals(False)
+        with _signals_blocked(self.chk_visible):
+            self.chk_visible.setChecked(visible)
 
     def set_gamma(self, gamma):
         """Update gamma spinbox without emitting signal."""
-        self.gamma_spin.blockSignals(True)
-        self.gamma_spin.setValue(gamma)
-        self.gamma_spin.blockSignals(False)
+        with _signals_blocked(self.gamma_spin):
+            self.gamma_spin.setValue(gamma)
 
 
 class ChannelPanel(QDialog):
@@ -955,6 +1192,9 @@ class ChannelPanel(QDialog):
         self.setWindowFlags(Qt.Tool)
         self.resize(480, min(200 + viewer.C * 60, 500))
 
+        # Coalesce canvas repaints from rapid control changes
+        self._update_timer = _coalescing_timer(self, self._repaint)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(4)
@@ -983,6 +1223,14 @@ class ChannelPanel(QDialog):
         self.channel_rows = []
         self._setup_channel_rows()
 
+        # Last auto-contrast result, reused while the slice is unchanged
+        self._auto_clim_source = None
+        self._auto_clims = []
+
+        # Per-channel histograms of the current slice, keyed by channel
+        self._hist_source = None
+        self._hists = {}
+
         # Auto-contrast button row
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -1001,6 +1249,7 @@ class ChannelPanel(QDialog):
         """Create a row widget for each channel."""
         n_channels = self.viewer.C
         meta_channels = self.viewer.meta.get("channels", [])
+        self._sync_colors()
 
         for c in range(n_channels):
             # Get channel name from metadata or use default
@@ -1009,12 +1258,7 @@ class ChannelPanel(QDialog):
             else:
                 ch_name = f"Ch {c + 1}"
 
-            # Get color from renderer
-            color = self.viewer.renderer.channel_colors[
-                c % len(self.viewer.renderer.channel_colors)
-            ]
-
-            row = ChannelRow(c, ch_name, color)
+            row = ChannelRow(c, ch_name, self._colors_by_channel[c])
             row.visibilityChanged.connect(self._on_visibility_changed)
             row.climChanged.connect(self._on_clim_changed)
             row.colormapChanged.connect(self._on_colormap_changed)
@@ -1025,34 +1269,39 @@ class ChannelPanel(QDialog):
 
         self.rows_layout.addStretch()
 
+    def _sync_colors(self):
+        """Cache each channel's display color from the renderer."""
+        colors = self.viewer.renderer.channel_colors
+        self._colors_by_channel = [
+            colors[c % len(colors)] for c in range(self.viewer.C)
+        ]
+
     def _on_visibility_changed(self, channel_idx, visible):
         """Handle visibility toggle for a channel."""
         self.viewer.renderer.set_channel_visible(channel_idx, visible)
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _on_clim_changed(self, channel_idx, vmin, vmax):
         """Handle contrast change for a channel."""
         self.viewer.renderer.set_clim(channel_idx, vmin, vmax)
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _on_colormap_changed(self, channel_idx, cmap_name):
         """Handle colormap change for a channel."""
         self.viewer.renderer.set_colormap(channel_idx, cmap_name)
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
-        # Update color swatch
-        color = self.viewer.renderer.channel_colors[
-            channel_idx % len(self.viewer.renderer.channel_colors)
+        # Refresh swatch and histogram with the new color
+        colors = self.viewer.renderer.channel_colors
+        self._colors_by_channel[channel_idx] = colors[
+            channel_idx % len(colors)
         ]
-        self.channel_rows[channel_idx]._update_color_swatch(color)
-
-        # Refresh histogram with new color
-        self.refresh_ui()
+        self.refresh_channel(channel_idx)
 
     def _on_gamma_changed(self, channel_idx, gamma):
         """Handle gamma change for a channel."""
         self.viewer.renderer.set_gamma(channel_idx, gamma)
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _auto_contrast_all(self):
         """Apply auto contrast to all channels."""
@@ -1060,44 +1309,53 @@ class ChannelPanel(QDialog):
         if cache is None:
             return
 
-        for c in range(len(self.channel_rows)):
-            if c < cache.shape[0]:
-                plane = cache[c]
-                valid_data = plane[plane > 0]
-                if valid_data.size == 0:
-                    valid_data = plane
+        if cache is not self._auto_clim_source:
+            n = min(len(self.channel_rows), cache.shape[0])
+            self._auto_clims = _channel_clims(cache[:n], 0.5, 99.98)
+            self._auto_clim_source = cache
 
-                mn, mx = map(float, np.nanpercentile(valid_data, (0.5, 99.98)))
-                self.viewer.renderer.set_clim(c, mn, mx)
-                self.channel_rows[c].set_clim(mn, mx)
+        for c, (mn, mx) in enumerate(self._auto_clims):
+            self.viewer.renderer.set_clim(c, mn, mx)
+            self.channel_rows[c].set_clim(mn, mx)
 
+        self._update_timer.start()
+
+    def _repaint(self):
+        # Looked up per call: OrthoViewer.canvas returns a new proxy each time
         self.viewer.canvas.update()
 
     def refresh_ui(self):
         """Refresh all channel rows with current data."""
+        self._sync_colors()
+        for c in range(len(self.channel_rows)):
+            self.refresh_channel(c)
+
+    def refresh_channel(self, c):
+        """Refresh a single channel row with current data."""
         cache = self.viewer.renderer.current_slice_cache
-        if cache is None:
+        if cache is None or c >= cache.shape[0]:
             return
 
-        for c, row in enumerate(self.channel_rows):
-            if c < cache.shape[0]:
-                plane = cache[c]
-                color = self.viewer.renderer.channel_colors[
-                    c % len(self.viewer.renderer.channel_colors)
-                ]
-                row.set_data(plane, color)
+        if cache is not self._hist_source:
+            self._hist_source = cache
+            self._hists = {}
+        if c not in self._hists:
+            self._hists[c] = _fast_hist(cache[c])
+
+        row = self.channel_rows[c]
+        row.set_histogram(*self._hists[c], self._colors_by_channel[c])
 
-                # Update clim
-                vmin, vmax = self.viewer.renderer.get_clim(c)
-                row.set_clim(vmin, vmax)
+        # Update clim
+        vmin, vmax = self.viewer.renderer.get_clim(c)
+        row.set_clim(vmin, vmax)
 
-                # Update visibility state
-                visible = self.viewer.renderer.get_channel_visible(c)
-                row.set_visible_state(visible)
+        # Update visibility state
+        visible = self.viewer.renderer.get_channel_visible(c)
+        row.set_visible_state(visible)
 
-                # Update gamma
-                gamma = self.viewer.renderer.get_gamma(c)
-                row.set_gamma(gamma)
+        # Update gamma
+        gamma = self.viewer.renderer.get_gamma(c)
+        row.set_gamma(gamma)
 
 
 class MetadataDialog(QDialog):
@@ -1119,28 +1377,32 @@ class MetadataDialog(QDialog):
         self.populate_table(metadata)
 
     def populate_table(self, metadata):
-        self.table.setRowCount(0)
-        for key, value in metadata.items():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Key
-            k_item = QTableWidgetItem(str(key))
-            k_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table.setItem(row, 0, k_item)
-
-            # Value
-            v_str = str(value)
-            # If value is a long list/array, truncate it?
-            if (
-                isinstance(value, (list, tuple, np.ndarray))
-                and len(value) > 10
-            ):
-                v_str = f"{type(value).__name__} shape={np.shape(value)}"
-
-            v_item = QTableWidgetItem(v_str)
-            v_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table.setItem(row, 1, v_item)
+        items = list(metadata.items())
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Allocate all rows up front instead of inserting one at a time
+            self.table.setRowCount(len(items))
+            for row, (key, value) in enumerate(items):
+                # Key
+                k_item = QTableWidgetItem(str(key))
+                k_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                self.table.setItem(row, 0, k_item)
+
+                # Value: summarize long lists/arrays instead of printing them
+                if (
+                    isinstance(value, (list, tuple, np.ndarray))
+                    and len(value) > 10
+                ):
+                    shape = getattr(value, "shape", (len(value),))
+                    v_str = f"{type(value).__name__} shape={shape}"
+                else:
+                    v_str = str(value)
+
+                v_item = QTableWidgetItem(v_str)
+                v_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                self.table.setItem(row, 1, v_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
 
 class TransformDialog(QDialog):
@@ -1156,6 +1418,9 @@ class TransformDialog(QDialog):
         self.setWindowFlags(Qt.Tool)
         self.resize(320, 180)
 
+        # Coalesce canvas repaints from rapid control changes
+        self._update_timer = _coalescing_timer(self, self._repaint)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
@@ -1252,7 +1517,7 @@ class TransformDialog(QDialog):
         self.rotation_slider.setValue(int(value * 10))
         self.rotation_slider.blockSignals(False)
         self.viewer.renderer.rotation_deg = value
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _on_rotation_slider_changed(self, value):
         rot_deg = value / 10.0
@@ -1260,34 +1525,38 @@ class TransformDialog(QDialog):
         self.rotation_spin.setValue(rot_deg)
         self.rotation_spin.blockSignals(False)
         self.viewer.renderer.rotation_deg = rot_deg
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _on_translate_x_changed(self, value):
         self.viewer.renderer.translate_x = value
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _on_translate_y_changed(self, value):
         self.viewer.renderer.translate_y = value
-        self.viewer.canvas.update()
+        self._update_timer.start()
+
+    def _set_controls(self, rotation, tx, ty):
+        """Set transform controls in one repaint without emitting signals."""
+        self.setUpdatesEnabled(False)
+        try:
+            with _signals_blocked(
+                self.rotation_spin,
+                self.rotation_slider,
+                self.translate_x_spin,
+                self.translate_y_spin,
+            ):
+                self.rotation_spin.setValue(rotation)
+                self.rotation_slider.setValue(int(rotation * 10))
+                self.translate_x_spin.setValue(tx)
+                self.translate_y_spin.setValue(ty)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _reset_transform(self):
         self.viewer.renderer.reset_transform()
-        self.rotation_spin.blockSignals(True)
-        self.rotation_slider.blockSignals(True)
-        self.translate_x_spin.blockSignals(True)
-        self.translate_y_spin.blockSignals(True)
-
-        self.rotation_spin.setValue(0.0)
-        self.rotation_slider.setValue(0)
-        self.translate_x_spin.setValue(0.0)
-        self.translate_y_spin.setValue(0.0)
+        self._set_controls(0.0, 0.0, 0.0)
 
-        self.rotation_spin.blockSignals(False)
-        self.rotation_slider.blockSignals(False)
-        self.translate_x_spin.blockSignals(False)
-        self.translate_y_spin.blockSignals(False)
-
-        self.viewer.canvas.update()
+        self._update_timer.start()
 
     def _apply_transform(self):
         """Bake current rotation/translation into image data."""
@@ -1322,20 +1591,7 @@ class TransformDialog(QDialog):
             self.viewer.renderer.reset_transform()
 
             # Reset UI controls
-            self.rotation_spin.blockSignals(True)
-            self.rotation_slider.blockSignals(True)
-            self.translate_x_spin.blockSignals(True)
-            self.translate_y_spin.blockSignals(True)
-
-            self.rotation_spin.setValue(0.0)
-            self.rotation_slider.setValue(0)
-            self.translate_x_spin.setValue(0.0)
-            self.translate_y_spin.setValue(0.0)
-
-            self.rotation_spin.blockSignals(False)
-            self.rotation_slider.blockSignals(False)
-            self.translate_x_spin.blockSignals(False)
-            self.translate_y_spin.blockSignals(False)
+            self._set_controls(0.0, 0.0, 0.0)
 
             # Refresh display
             self.viewer.update_view()
@@ -1343,24 +1599,17 @@ class TransformDialog(QDialog):
         finally:
             self.apply_btn.setEnabled(True)
 
+    def _repaint(self):
+        # Looked up per call: OrthoViewer.canvas returns a new proxy each time
+        self.viewer.canvas.update()
+
     def refresh_ui(self):
         """Refresh UI to match current renderer state."""
-        self.rotation_spin.blockSignals(True)
-        self.rotation_slider.blockSignals(True)
-        self.translate_x_spin.blockSignals(True)
-        self.translate_y_spin.blockSignals(True)
-
-        self.rotation_spin.setValue(self.viewer.renderer.rotation_deg)
-        self.rotation_slider.setValue(
-            int(self.viewer.renderer.rotation_deg * 10)
+        self._set_controls(
+            self.viewer.renderer.rotation_deg,
+            self.viewer.renderer.translate_x,
+            self.viewer.renderer.translate_y,
         )
-        self.translate_x_spin.setValue(self.viewer.renderer.translate_x)
-        self.translate_y_spin.setValue(self.viewer.renderer.translate_y)
-
-        self.rotation_spin.blockSignals(False)
-        self.rotation_slider.blockSignals(False)
-        self.translate_x_spin.blockSignals(False)
-        self.translate_y_spin.blockSignals(False)
 
 
 class AlignmentDialog(QDialog):
@@ -1382,9 +1631,27 @@ class AlignmentDialog(QDialog):
         self.manager = manager
 
         self._overlay_layers = []  # Track overlay layers for cleanup
+        self._overlay_parent = None  # Reference window holding the layers
         self._reference_window = None
         self._query_window = None
 
+        # Stride applied to query planes before upload as overlay textures
+        self._overlay_step = 1
+
+        # Last overlay transform, reused while its parameters are unchanged
+        self._cached_transform_key = None
+        self._cached_transform = None
+
+        # Coalesce reference canvas repaints from slider drags
+        self._update_timer = _coalescing_timer(
+            self, self._update_reference_canvas
+        )
+
+        # Apply only the latest transform from slider/spinbox bursts
+        self._xform_timer = _coalescing_timer(
+            self, self._do_update_overlay_transform
+        )
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
@@ -1567,6 +1834,10 @@ class AlignmentDialog(QDialog):
         self.opacity_label.setText(f"{value}%")
         self._update_overlay_opacity()
 
+    def _update_reference_canvas(self):
+        if self._reference_window:
+            self._reference_window.canvas.update()
+
     def _remove_overlay(self):
         """Remove any existing overlay layers."""
         for layer in self._overlay_layers:
@@ -1575,82 +1846,79 @@ class AlignmentDialog(QDialog):
             except Exception:
                 pass
         self._overlay_layers = []
+        self._overlay_parent = None
         if self._reference_window:
             self._reference_window.canvas.update()
 
     def _update_overlay(self):
         """Create or update the overlay of query on reference."""
-        self._remove_overlay()
-
         if not self._reference_window or not self._query_window:
+            self._remove_overlay()
             return
 
         if self._reference_window is self._query_window:
+            self._remove_overlay()
             return  # Same window, no overlay needed
 
         # Get query image data (current slice)
         query_cache = self._query_window.renderer.current_slice_cache
         if query_cache is None:
+            self._remove_overlay()
             return
 
-        # Create overlay layers in reference window
-        from vispy import scene
-        from vispy.visuals.transforms.chain import ChainTransform
-        from vispy.visuals.transforms.linear import (
-            MatrixTransform,
-            STTransform,
-        )
-
-        opacity = self.opacity_slider.value() / 100.0
-
-        # Add each channel from query as an overlay
-        for c in range(query_cache.shape[0]):
-            plane = query_cache[c]
-
-            # Get colormap from query
-            cmap_name = self._query_window.renderer.get_colormap_name(c)
-            from pyvistra.visuals import get_colormap
+        # Layers live in the reference scene; rebuild them only when the
+        # reference or channel count changes, otherwise update in place
+        n_channels = query_cache.shape[0]
+        if (
+            self._overlay_parent is not self._reference_window
+            or len(self._overlay_layers) != n_channels
+        ):
+            self._remove_overlay()
+            for c in range(n_channels):
+                overlay = scene.visuals.Image(
+                    parent=self._reference_window.view.scene,
+                    method="auto",
+                    interpolation="nearest",
+                )
+                # Set blending for overlay
+                overlay.set_gl_state(
+                    preset="translucent",
+                    blend=True,
+                    blend_func=("src_alpha", "one_minus_src_alpha"),
+                    depth_test=False,
+                )
+                overlay.order = 100 + c  # Render on top
+                self._overlay_layers.append(overlay)
+            self._overlay_parent = self._reference_window
 
-            cmap, _ = get_colormap(cmap_name)
+        # Downsample large planes so the overlay texture stays near screen size
+        Y, X = query_cache.shape[-2:]
+        step = max(1, -(-max(Y, X) // OVERLAY_MAX_SIZE))
+        self._overlay_step = step
 
-            # Create image visual
-            overlay = scene.visuals.Image(
-                plane,
-                cmap=cmap,
-                clim=self._query_window.renderer.get_clim(c),
-                parent=self._reference_window.view.scene,
-                method="auto",
-                interpolation="nearest",
-            )
+        opacity = self.opacity_slider.value() / 100.0
+        transform = self._build_overlay_transform()
+        renderer = self._query_window.renderer
 
-            # Inherit gamma from query window's contrast settings
-            overlay.gamma = self._query_window.renderer.get_gamma(c)
+        for c, overlay in enumerate(self._overlay_layers):
+            # The query's uint8 preview already has its clim applied
+            overlay.set_data(renderer.get_preview_u8(c, step))
 
-            # Set blending for overlay
-            overlay.set_gl_state(
-                preset="translucent",
-                blend=True,
-                blend_func=("src_alpha", "one_minus_src_alpha"),
-                depth_test=False,
-            )
+            # Inherit colormap and gamma from the query window
+            cmap, _ = get_colormap(renderer.get_colormap_name(c))
+            overlay.cmap = cmap
+            overlay.clim = (0, 255)
+            overlay.gamma = renderer.get_gamma(c)
             overlay.opacity = opacity
-            overlay.order = 100 + c  # Render on top
-
-            # Apply transform
-            overlay.transform = self._build_overlay_transform()
 
-            self._overlay_layers.append(overlay)
+            # Apply transform (shared by all channel layers)
+            if overlay.transform is not transform:
+                overlay.transform = transform
 
-        self._reference_window.canvas.update()
+        self._update_timer.start()
 
     def _build_overlay_transform(self):
         """Build transform for overlay layers."""
-
-        from vispy.visuals.transforms.linear import (
-            MatrixTransform,
-            STTransform,
-        )
-
         if not self._query_window:
             return STTransform()
 
@@ -1665,31 +1933,51 @@ class AlignmentDialog(QDialog):
         rot_deg = self.rotation_spin.value()
         tx = self.translate_x_spin.value()
         ty = self.translate_y_spin.value()
+        step = self._overlay_step
 
-        if rot_deg == 0.0 and tx == 0.0 and ty == 0.0:
-            return STTransform(scale=(sx, sy))
+        key = (rot_deg, tx, ty, sx, sy, X, Y, step)
+        if key == self._cached_transform_key:
+            return self._cached_transform
 
-        # Build transform for rotation around image center:
-        # 1. Scale, 2. Translate center to origin, 3. Rotate, 4. Translate back + offset
-        transform = MatrixTransform()
-        transform.scale((sx, sy, 1))
-        transform.translate((-cx, -cy, 0))
-        transform.rotate(rot_deg, (0, 0, 1))
-        transform.translate((cx + tx, cy + ty, 0))
+        # Overlay planes are strided by `step`, so scale them back up
+        if rot_deg == 0.0 and tx == 0.0 and ty == 0.0:
+            transform = STTransform(scale=(sx * step, sy * step))
+        else:
+            # Build transform for rotation around image center:
+            # 1. Scale, 2. Translate center to origin, 3. Rotate, 4. Translate back + offset
+            transform = MatrixTransform(
+                center_rotation_matrix(
+                    sx * step, sy * step, cx, cy, rot_deg, tx, ty
+                )
+            )
 
+        self._cached_transform_key = key
+        self._cached_transform = transform
         return transform
 
     def _update_overlay_transform(self):
+        """Schedule a transform update on existing overlay layers."""
+        self._xform_timer.start()
+
+    def _do_update_overlay_transform(self):
         """Update transform on existing overlay layers."""
         if not self._overlay_layers:
             return
 
+        # The builder returns its cached transform while the parameters are
+        # unchanged; skip reassigning it so vispy doesn't re-walk the graph
         transform = self._build_overlay_transform()
-        for layer in self._overlay_layers:
+        stale = [
+            layer for layer in self._overlay_layers
+            if layer.transform is not transform
+        ]
+        if not stale:
+            return
+        for layer in stale:
             layer.transform = transform
 
-        if self._reference_window:
-            self._reference_window.canvas.update()
+        # Already coalesced by _xform_timer, so repaint right away
+        self._update_reference_canvas()
 
     def _update_overlay_opacity(self):
         """Update opacity on existing overlay layers."""
@@ -1697,25 +1985,24 @@ class AlignmentDialog(QDialog):
         for layer in self._overlay_layers:
             layer.opacity = opacity
 
-        if self._reference_window:
-            self._reference_window.canvas.update()
+        self._update_timer.start()
 
     def _reset_transform(self):
         """Reset transform controls to zero."""
-        self.rotation_spin.blockSignals(True)
-        self.rotation_slider.blockSignals(True)
-        self.translate_x_spin.blockSignals(True)
-        self.translate_y_spin.blockSignals(True)
-
-        self.rotation_spin.setValue(0.0)
-        self.rotation_slider.setValue(0)
-        self.translate_x_spin.setValue(0.0)
-        self.translate_y_spin.setValue(0.0)
-
-        self.rotation_spin.blockSignals(False)
-        self.rotation_slider.blockSignals(False)
-        self.translate_x_spin.blockSignals(False)
-        self.translate_y_spin.blockSignals(False)
+        self.setUpdatesEnabled(False)
+        try:
+            with _signals_blocked(
+                self.rotation_spin,
+                self.rotation_slider,
+                self.translate_x_spin,
+                self.translate_y_spin,
+            ):
+                self.rotation_spin.setValue(0.0)
+                self.rotation_slider.setValue(0)
+                self.translate_x_spin.setValue(0.0)
+                self.translate_y_spin.setValue(0.0)
+        finally:
+            self.setUpdatesEnabled(True)
 
         self._update_overlay_transform()
 
@@ -1,6 +1,5 @@
 # %%
 import h5py
-import numpy as np
 from pyvistra.imaris_reader import ImarisReader
 
 
@@ -17,27 +16,21 @@ def h5_tree(val, pre=""):
         val: The h5py object (File or Group) to iterate over.
         pre: The prefix string for indentation (used internally).
     """
-    # Get the list of items in the current group
-    items = len(val)
-
-    for key, val in val.items():
-        items -= 1
-
-        # Determine if we are at the last item to choose the correct connector
-        if items == 0:
-            connector = "└── "
-            # If last item, child prefix adds spaces
-            child_pre = pre + "    "
-        else:
-            connector = "├── "
-            # If not last, child prefix adds a vertical bar
-            child_pre = pre + "│   "
+    # Connectors for (not last, last) children; the child prefix grows by a
+    # bar for non-last items and by spaces for the last one
+    connectors = ("├── ", "└── ")
+    child_pads = ("│   ", "    ")
+    last_index = len(val) - 1
+
+    for i, (key, val) in enumerate(val.items()):
+        is_last = i == last_index
+        connector = connectors[is_last]
 
         # Distinguish between Groups and Datasets for formatting
         if isinstance(val, h5py.Group):
             print(f"{pre}{connector}📂 {key}")
             # Recursively call for the subgroup
-            h5_tree(val, child_pre)
+            h5_tree(val, pre + child_pads[is_last])
 
         elif isinstance(val, h5py.Dataset):
             # For datasets, print shape and dtype info
@@ -49,15 +42,31 @@ def h5_tree(val, pre=""):
 # %%
 datfn = "/users/delnatan/Downloads/UD877_wt_03.ims"
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import json
 
+
+def decode_attr(vals):
+    """Decode an attribute stored as a byte array or a bytes/str scalar."""
+    if isinstance(vals, str):
+        return vals
+    if isinstance(vals, bytes):
+        return vals.decode("utf-8", errors="replace")
+    # Arrays of single bytes: decode the whole buffer at once
+    return vals.tobytes().decode("utf-8", errors="replace")
+
+
 with h5py.File(datfn, "r") as h5:
     # h5_tree(h5["DataSetInfo"])
     custom_data_dict = dict(h5["DataSetInfo/CustomData"].attrs.items())
-    data = {
-        k: "".join(np.char.decode(vals))
-        for k, vals in custom_data_dict.items()
-    }
-    with open("custom_data.json", "w") as fhd:
-        json.dump(data, fhd, indent=2)
+    data = {k: decode_attr(vals) for k, vals in custom_data_dict.items()}
+    if orjson is not None:
+        with open("custom_data.json", "wb") as fhd:
+            fhd.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open("custom_data.json", "w") as fhd:
+            json.dump(data, fhd, indent=2)
 # %%
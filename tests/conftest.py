@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single themed QApplication shared by every test in the session."""
+    from qtpy.QtWidgets import QApplication
+
+    from pyvistra.theme import DARK_THEME
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(DARK_THEME)
+    yield app
@@ -4,68 +4,21 @@ This test verifies that the application can quit cleanly in both scenarios:
 1. Quit immediately without opening any image (previously caused segfault)
 2. Quit after opening an image (always worked)
 
-Segfaults result in exit code -11 (SIGSEGV) on Linux.
+Segfaults result in exit code -11 (SIGSEGV) on Linux. The no-image case runs
+in a subprocess so a regression shows up as that exit code; the image case
+runs in-process, relying on pytest's faulthandler to report native crashes.
 """
 
 import os
 import signal
 import subprocess
 import sys
-import tempfile
 
 import numpy as np
 
-
-def run_quit_test(
-    open_image: bool, timeout: float = 5.0
-) -> tuple[int, str, str]:
-    """
-    Run the app and quit after a short delay.
-
-    Args:
-        open_image: If True, create and open a test image before quitting
-        timeout: Maximum time to wait for the process
-
-    Returns:
-        Tuple of (exit_code, stdout, stderr)
-    """
-
-    if open_image:
-        # Create a temporary test image
-        test_script = """
-import sys
-import numpy as np
-from qtpy.QtCore import QTimer
-from qtpy.QtWidgets import QApplication
-
-# Must create QApplication before importing pyvistra UI components
-app = QApplication(sys.argv)
-
-from pyvistra.ui import Toolbar, imshow
-from pyvistra.theme import DARK_THEME
-
-app.setStyleSheet(DARK_THEME)
-
-# Create toolbar
-toolbar = Toolbar()
-toolbar.show()
-
-# Create a small test image and show it
-data = np.random.randint(0, 255, (10, 100, 100), dtype=np.uint8)
-
-def open_and_quit():
-    viewer = imshow(data, title="Test Image", dims="zyx")
-    # Schedule quit after image is shown
-    QTimer.singleShot(500, app.quit)
-
-# Open image after toolbar is shown
-QTimer.singleShot(200, open_and_quit)
-
-sys.exit(app.exec_())
-"""
-    else:
-        # Just show toolbar and quit without opening any image
-        test_script = """
+# Toolbar-only quit, run in a child process so a segfault (the original
+# regression) is reported as an exit code instead of killing the test run
+QUIT_WITHOUT_IMAGE_SCRIPT = """
 import sys
 from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QApplication
@@ -88,9 +41,19 @@ QTimer.singleShot(500, app.quit)
 sys.exit(app.exec_())
 """
 
-    # Run in subprocess
+
+def run_quit_test(timeout: float = 5.0) -> tuple[int, str, str]:
+    """
+    Run the toolbar-only app in a subprocess and quit after a short delay.
+
+    Args:
+        timeout: Maximum time to wait for the process
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+    """
     result = subprocess.run(
-        [sys.executable, "-c", test_script],
+        [sys.executable, "-c", QUIT_WITHOUT_IMAGE_SCRIPT],
         capture_output=True,
         text=True,
         timeout=timeout,
@@ -103,6 +66,51 @@ sys.exit(app.exec_())
     return result.returncode, result.stdout, result.stderr
 
 
+def run_quit_with_image_in_process(app) -> int:
+    """
+    Show the toolbar, open an image, and quit the event loop in this process.
+    Quitting closes every top-level window, and the image window (deleted
+    on close) takes its vispy canvas and GL context with it. The toolbar is
+    then deleted and the deferred deletes processed, so nothing is left
+    alive in the shared QApplication. The QApplication itself is not
+    destroyed here; that part of shutdown is not covered in-process.
+
+    Args:
+        app: The themed QApplication to run (created before pyvistra UI
+            components are imported)
+
+    Returns:
+        The exit code returned by app.exec_()
+    """
+    from qtpy.QtCore import QCoreApplication, QEvent, QTimer
+
+    from pyvistra.ui import Toolbar, imshow
+
+    # Create toolbar
+    toolbar = Toolbar()
+    toolbar.show()
+
+    # Create a small test image and show it
+    data = np.random.default_rng(0).integers(
+        0, 255, (10, 100, 100), dtype=np.uint8
+    )
+    def open_and_quit():
+        imshow(data, title="Test Image", dims="zyx")
+        # Schedule quit after image is shown
+        QTimer.singleShot(500, app.quit)
+
+    # Open image after toolbar is shown
+    QTimer.singleShot(200, open_and_quit)
+
+    exit_code = app.exec_()
+
+    toolbar.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+
+    return exit_code
+
+
 def exit_code_to_signal_name(code: int) -> str:
     """Convert negative exit code to signal name."""
     if code >= 0:
@@ -121,7 +129,7 @@ def test_quit_without_image():
     print("Testing: Quit WITHOUT opening an image...")
 
     try:
-        exit_code, stdout, stderr = run_quit_test(open_image=False)
+        exit_code, stdout, stderr = run_quit_test()
     except subprocess.TimeoutExpired:
         print("  FAIL: Process timed out")
         return False
@@ -146,33 +154,13 @@ def test_quit_without_image():
         return True
 
 
-def test_quit_with_image():
-    """Test that quitting after opening an image does not segfault."""
+def test_quit_with_image(qapp):
+    """Test that quitting after opening an image exits the event loop cleanly."""
     print("Testing: Quit AFTER opening an image...")
 
-    try:
-        exit_code, stdout, stderr = run_quit_test(open_image=True)
-    except subprocess.TimeoutExpired:
-        print("  FAIL: Process timed out")
-        return False
-
-    if exit_code == -signal.SIGSEGV:
-        print(
-            f"  FAIL: Segmentation fault detected! ({exit_code_to_signal_name(exit_code)})"
-        )
-        if stderr:
-            print(f"  stderr: {stderr[:500]}")
-        return False
-    elif exit_code != 0:
-        print(
-            f"  WARN: Non-zero exit code: {exit_code_to_signal_name(exit_code)}"
-        )
-        if stderr:
-            print(f"  stderr: {stderr[:500]}")
-        return exit_code != -signal.SIGSEGV
-    else:
-        print("  PASS: Clean exit")
-        return True
+    exit_code = run_quit_with_image_in_process(qapp)
+    assert exit_code == 0, exit_code_to_signal_name(exit_code)
+    print("  PASS: Clean exit")
 
 
 if __name__ == "__main__":
@@ -188,7 +176,19 @@ if __name__ == "__main__":
     print()
 
     # Test with image (this always worked)
-    results.append(("Quit with image", test_quit_with_image()))
+    from qtpy.QtWidgets import QApplication
+
+    from pyvistra.theme import DARK_THEME
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(DARK_THEME)
+    try:
+        test_quit_with_image(app)
+    except AssertionError as exc:
+        print(f"  FAIL: Non-zero exit code: {exc}")
+        results.append(("Quit with image", False))
+    else:
+        results.append(("Quit with image", True))
     print()
 
     # Summary
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+import tifffile
+from pyvistra.io import Numpy5DProxy, save_tiff
+
+
+def _imagej_tags(path):
+    with tifffile.TiffFile(path) as tif:
+        page = tif.pages[0]
+        return (
+            tif.series[0].axes,
+            tif.imagej_metadata,
+            page.tags["XResolution"].value,
+            page.tags["YResolution"].value,
+        )
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_save_tiff_proxy_roundtrip(tmp_path, dtype):
+    # Proxies take the streamed tifffile.memmap path; the result must match
+    # what tifffile.imwrite produces for the same in-memory array
+    rng = np.random.default_rng(0)
+    image = (rng.random((2, 3, 2, 16, 24)) * 200).astype(dtype)
+    scale = (2.0, 0.5, 0.25)
+
+    streamed = tmp_path / "proxy.tif"
+    save_tiff(str(streamed), Numpy5DProxy(image), scale=scale)
+
+    reference = tmp_path / "array.tif"
+    tifffile.imwrite(
+        reference,
+        image,
+        imagej=True,
+        resolution=(4.0, 2.0),
+        metadata={"axes": "TZCYX", "spacing": 2.0, "unit": "um"},
+    )
+
+    loaded = tifffile.imread(streamed)
+    assert loaded.dtype == image.dtype
+    np.testing.assert_array_equal(loaded, image)
+
+    axes, meta, xres, yres = _imagej_tags(streamed)
+    assert axes == "TZCYX"
+    assert meta["spacing"] == 2.0
+    assert meta["unit"] == "um"
+    assert (meta["frames"], meta["slices"], meta["channels"]) == (2, 3, 2)
+    assert xres[0] / xres[1] == pytest.approx(4.0)
+    assert yres[0] / yres[1] == pytest.approx(2.0)
+    assert (axes, meta, xres, yres) == _imagej_tags(reference)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main([__file__, "-q"]))
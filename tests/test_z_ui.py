@@ -12,7 +12,7 @@ def verify_ui():
     print("Verifying Z-Projection UI...")
     
     # Create synthetic data (T=1, Z=10, C=1, Y=100, X=100)
-    data = np.random.rand(1, 10, 1, 100, 100).astype(np.float32)
+    data = np.random.default_rng(0).random((1, 10, 1, 100, 100), dtype=np.float32)
     
     win = ImageWindow(data, title="Test Window")
     win.show()